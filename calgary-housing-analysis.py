@@ -22,12 +22,22 @@ Dataset Classification:
 - Suburban: Communities with 'BUILDING OUT', post-1980s development, or new/developing areas
 """
 
+import sys
+from functools import cached_property
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from matplotlib.ticker import StrMethodFormatter
+from openpyxl import Workbook
 
 from clean_dataset import load_and_prepare_data
 
+try:
+    import readline
+except ImportError:  # readline is not available on Windows
+    readline = None
+
 
 class CalgaryHousingAnalyzer:
     """
@@ -43,21 +53,48 @@ class CalgaryHousingAnalyzer:
         df (pd.DataFrame): Merged and cleaned dataset containing census, assessment, and ward information
         user_community (str): Community selected by the user
         user_year (int): Year selected by the user
+        _communities (frozenset): Community names in the dataset, for constant-time validation
+        _year_level (pd.Index): YEAR value of every record, taken from the index once
+
+    Cached Properties (computed on first use and shared by the analysis and visualization steps):
+        _sector_mask (pd.Series): Boolean mask of records with a sector and a positive population
+        _valid_assessment_mask (pd.Series): Boolean mask of records with an assessment and a positive population
+        _high_value_mask (pd.Series): Boolean mask of records with a median assessment above $600,000
+        _sector_yearly (pd.DataFrame): Assessment, population, and vacancy summary by sector and year
+        _sector_stats (pd.DataFrame): Population, assessment, and vacancy summary by sector
+        _sector_growth (pd.DataFrame): Sector populations for 2016 and 2017 with change and growth rate
+        _area_yearly (pd.DataFrame): Population, assessment, and vacancy summary by area type and year
     """
 
     def __init__(self):
         """Initialize the analyzer by loading and preparing the dataset."""
         print("Loading Calgary Housing and Demographics Data...")
+        census_path = (
+            "CSVFiles/Civic_Census_by_Community_and_Dwelling_Structure_20250613.csv"
+        )
+        assessment_path = "CSVFiles/Assessments by Community Jun 2025.csv"
+        ward_path = "CSVFiles/Communities by Ward June 2025.csv"
+
+        # Reuse the merged dataset from a previous run unless a source file changed
         self.df = load_and_prepare_data(
-            census_path="CSVFiles/Civic_Census_by_Community_and_Dwelling_Structure_20250613.csv",
-            assessment_path="CSVFiles/Assessments by Community Jun 2025.csv",
-            ward_path="CSVFiles/Communities by Ward June 2025.csv",
+            census_path=census_path,
+            assessment_path=assessment_path,
+            ward_path=ward_path,
+            use_cache=True,
         )
         print(f"Dataset loaded successfully! {len(self.df)} records available.")
 
+        # Keep the (COMMUNITY_NAME, YEAR) index sorted so .loc lookups can use
+        # binary search instead of scanning
+        if not self.df.index.is_monotonic_increasing:
+            self.df.sort_index(inplace=True)
+        self._communities = frozenset(self.df.index.levels[0])
+        self._year_level = self.df.index.get_level_values("YEAR")
+
         # Display missing values summary
         print("\nMissing Values Summary:")
-        missing_counts = self.df.isna().sum()
+        # count() tallies non-null values per column without building a boolean frame
+        missing_counts = len(self.df) - self.df.count()
         missing_counts = missing_counts[missing_counts > 0]
         if len(missing_counts) > 0:
             for col, count in missing_counts.items():
@@ -98,7 +135,147 @@ class CalgaryHousingAnalyzer:
             self.df["WARD_NUM"] = self.df["WARD_NUM"].fillna(self.df["WARD"])
 
         # For percentage/rate columns, keep NaN to indicate "cannot calculate"
-        # These are already handled in clean_dataset.py with .replace(0, pd.NA)
+        # clean_dataset.py already computes them as float64 with NaN where the divisor is 0
+
+        # Downcast count columns to the smallest integer type that holds them
+        # (signed, so year-over-year differences can go negative)
+        # Median assessments are whole dollars, so they downcast exactly as well
+        for col in fill_zero_cols + ["RES_CNT", "DWELLINGS_TOTAL", "MEDIAN_ASSESSMENT"]:
+            if col in self.df.columns:
+                self.df[col] = pd.to_numeric(self.df[col], downcast="integer")
+
+        # The ratio columns arrive from clean_dataset.py as float64 with NaN where
+        # the divisor was 0; float32 is precise enough for them
+        for col in ("ASSESSMENT_PER_PERSON", "VACANCY_RATE"):
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype("float32")
+
+        # Store WARD as a category once it is coalesced (SECTOR, AREA_TYPE, and
+        # DWELLING_TYPE_DESCRIPTION are already categories from clean_dataset.py)
+        if "WARD" in self.df.columns:
+            self.df["WARD"] = self.df["WARD"].astype("category")
+
+    @cached_property
+    def _sector_mask(self):
+        """
+        Boolean mask selecting records that have a sector and a positive population.
+
+        Parameters:
+            None
+        Returns:
+            pd.Series: Boolean mask aligned with the dataset index
+        """
+        return self.df["SECTOR"].notna() & (self.df["RES_CNT"] > 0)
+
+    @cached_property
+    def _valid_assessment_mask(self):
+        """
+        Boolean mask selecting records that have an assessment and a positive population.
+
+        Parameters:
+            None
+        Returns:
+            pd.Series: Boolean mask aligned with the dataset index
+        """
+        return self.df["MEDIAN_ASSESSMENT"].notna() & (self.df["RES_CNT"] > 0)
+
+    @cached_property
+    def _high_value_mask(self):
+        """
+        Boolean mask selecting records with a median assessment above $600,000
+        (missing assessments compare as False).
+
+        Parameters:
+            None
+        Returns:
+            pd.Series: Boolean mask aligned with the dataset index
+        """
+        return self.df["MEDIAN_ASSESSMENT"] > 600000
+
+    @cached_property
+    def _sector_yearly(self):
+        """
+        Assessment, population, and vacancy summary by sector and year.
+
+        Parameters:
+            None
+        Returns:
+            pd.DataFrame: MEDIAN_ASSESSMENT mean, RES_CNT sum, and VACANCY_RATE mean indexed by (SECTOR, YEAR)
+        """
+        return self.df.groupby(["SECTOR", self._year_level], observed=True).agg(
+            {
+                "MEDIAN_ASSESSMENT": "mean",
+                "RES_CNT": "sum",
+                "VACANCY_RATE": "mean",
+            }
+        )
+
+    @cached_property
+    def _sector_stats(self):
+        """
+        Population, assessment, and vacancy summary by sector for valid records.
+
+        Parameters:
+            None
+        Returns:
+            pd.DataFrame: RES_CNT sum and MEDIAN_ASSESSMENT/VACANCY_RATE means indexed by SECTOR
+        """
+        # groupby already drops records without a sector, so only the
+        # population filter is needed before grouping. Every consumer ranks or
+        # sorts the result itself, so the groups are left in appearance order
+        return (
+            self.df[self.df["RES_CNT"] > 0]
+            .groupby("SECTOR", observed=True, dropna=True, sort=False)
+            .agg(
+                {"RES_CNT": "sum", "MEDIAN_ASSESSMENT": "mean", "VACANCY_RATE": "mean"}
+            )
+        )
+
+    @cached_property
+    def _sector_growth(self):
+        """
+        Population change from 2016 to 2017 for each sector with a 2016 population.
+
+        Parameters:
+            None
+        Returns:
+            pd.DataFrame: 2016, 2017, Change, and Growth_Rate (%) columns indexed by SECTOR
+        """
+        # One row per sector with a column for each year; the growth maths runs on
+        # the small (n_sectors x 2) NumPy array
+        wide = (
+            self._sector_yearly["RES_CNT"]
+            .unstack("YEAR")
+            .reindex(columns=[2016, 2017])
+            .dropna()
+        )
+        wide = wide[wide[2016] > 0]
+        pop = wide.to_numpy()
+        change = pop[:, 1] - pop[:, 0]
+        return wide.assign(Change=change, Growth_Rate=change / pop[:, 0] * 100)
+
+    @cached_property
+    def _area_yearly(self):
+        """
+        Population, assessment, and vacancy summary by area type and year.
+
+        Parameters:
+            None
+        Returns:
+            pd.DataFrame: RES_CNT sum and MEDIAN_ASSESSMENT/VACANCY_RATE means indexed by (AREA_TYPE, YEAR)
+        """
+        # groupby drops records without an area type, no pre-filter needed
+        return self.df.groupby(
+            ["AREA_TYPE", self._year_level],
+            observed=True,
+            dropna=True,
+        ).agg(
+            {
+                "RES_CNT": "sum",
+                "MEDIAN_ASSESSMENT": "mean",
+                "VACANCY_RATE": "mean",
+            }
+        )
 
     def get_user_input(self):
         """
@@ -110,7 +287,21 @@ class CalgaryHousingAnalyzer:
             tuple: (community_name, year) both validated against the dataset
         """
         # Get list of unique communities for validation
-        communities = sorted(self.df.index.get_level_values("COMMUNITY_NAME").unique())
+        communities = sorted(self._communities)
+
+        # Enable tab-completion of community names where readline is available
+        if readline is not None:
+            readline.set_completer_delims("\t\n")
+            readline.set_completer(
+                lambda text, state: (
+                    [comm for comm in communities if comm.startswith(text.upper())]
+                    + [None]
+                )[state]
+            )
+            if "libedit" in (readline.__doc__ or ""):
+                readline.parse_and_bind("bind ^I rl_complete")
+            else:
+                readline.parse_and_bind("tab: complete")
 
         # Get community input with validation
         while True:
@@ -133,7 +324,7 @@ class CalgaryHousingAnalyzer:
                     print()
                     continue
 
-                if community not in communities:
+                if community not in self._communities:
                     print(f"\nError: '{community}' not found.")
                     print(
                         "Tip: Try typing just the first few letters, or use 'list' to see all options"
@@ -185,25 +376,29 @@ class CalgaryHousingAnalyzer:
         # Get all data for this community/year combination
         community_data = self.df.loc[(community, year)]
 
+        # Community-level values repeat on every dwelling-type row, so read them
+        # once from the first row as a plain dict
+        first_row = community_data.iloc[0].to_dict()
+
         # Display key metrics
         print("\nBasic Information:")
 
         # Handle WARD display (can be float or NaN)
-        ward_value = community_data["WARD"].iloc[0]
+        ward_value = first_row["WARD"]
         if pd.notna(ward_value):
             print(f"  Ward: {int(ward_value)}")
         else:
             print("  Ward: N/A")
 
         # Handle SECTOR display
-        sector_value = community_data["SECTOR"].iloc[0]
+        sector_value = first_row["SECTOR"]
         if pd.notna(sector_value):
             print(f"  Sector: {sector_value}")
         else:
             print("  Sector: N/A")
 
         # Handle AREA_TYPE display
-        area_value = community_data["AREA_TYPE"].iloc[0]
+        area_value = first_row["AREA_TYPE"]
         if pd.notna(area_value):
             print(f"  Area Type: {area_value}")
         else:
@@ -225,8 +420,8 @@ class CalgaryHousingAnalyzer:
             print("  Vacancy Rate: N/A")
 
         print("\nAssessment Values:")
-        median_assess = community_data["MEDIAN_ASSESSMENT"].iloc[0]
-        assess_per_person = community_data["ASSESSMENT_PER_PERSON"].iloc[0]
+        median_assess = first_row["MEDIAN_ASSESSMENT"]
+        assess_per_person = first_row["ASSESSMENT_PER_PERSON"]
 
         if pd.notna(median_assess):
             print(f"  Median Assessment: ${median_assess:,.0f}")
@@ -239,10 +434,14 @@ class CalgaryHousingAnalyzer:
             print("  Assessment per Person: N/A")
 
         print("\nDwelling Types:")
-        dwelling_summary = community_data.groupby("DWELLING_TYPE_DESCRIPTION")[
-            "DWELLINGS_TOTAL"
-        ].sum()
-        for dtype, count in dwelling_summary.items():
+        # The slice holds only a handful of rows, so a plain dict total is cheaper
+        # than running the full groupby machinery
+        dwelling_summary = {}
+        for dtype, count in community_data[
+            ["DWELLING_TYPE_DESCRIPTION", "DWELLINGS_TOTAL"]
+        ].itertuples(index=False, name=None):
+            dwelling_summary[dtype] = dwelling_summary.get(dtype, 0) + count
+        for dtype, count in sorted(dwelling_summary.items()):
             if count > 0:
                 print(f"  {dtype}: {count:,.0f}")
 
@@ -263,13 +462,12 @@ class CalgaryHousingAnalyzer:
 
         # 1. Aggregation computation for subset
         print("\n1. AGGREGATION: Average Assessment by Area Type (2017 only):")
-        subset_2017 = self.df[self.df.index.get_level_values("YEAR") == 2017]
-        subset_2017_clean = subset_2017[
-            (subset_2017["MEDIAN_ASSESSMENT"].notna()) & (subset_2017["RES_CNT"] > 0)
-        ]
-        area_avg = subset_2017_clean.groupby("AREA_TYPE")["MEDIAN_ASSESSMENT"].agg(
-            ["mean", "count"]
-        )
+        is_2017 = self._year_level == 2017
+        subset_2017 = self.df[is_2017]
+        subset_2017_clean = self.df[self._valid_assessment_mask & is_2017]
+        area_avg = subset_2017_clean.groupby("AREA_TYPE", observed=True)[
+            "MEDIAN_ASSESSMENT"
+        ].agg(["mean", "count"])
         area_avg.columns = ["Average Assessment", "Community Count"]
         print(area_avg.round(0))
         print(
@@ -278,32 +476,28 @@ class CalgaryHousingAnalyzer:
 
         # 2. Masking operation
         print("\n2. MASKING: High-Value Communities (Median Assessment > $600,000):")
-        mask = (
-            (self.df["MEDIAN_ASSESSMENT"] > 600000)
-            & (self.df["MEDIAN_ASSESSMENT"].notna())
-            & (self.df["RES_CNT"] > 0)
-        )
+        mask = self._valid_assessment_mask & self._high_value_mask
         high_value = self.df[mask]
         print(f"  Total high-value records: {len(high_value)}")
         print(
             f"  Unique communities: {high_value.index.get_level_values('COMMUNITY_NAME').nunique()}"
         )
 
-        top_5 = high_value.nlargest(5, "MEDIAN_ASSESSMENT")[
+        # Rank only the assessment column, then select the winning rows by
+        # position (the index repeats across dwelling-type rows)
+        top_positions = (
+            high_value["MEDIAN_ASSESSMENT"].reset_index(drop=True).nlargest(5).index
+        )
+        top_5 = high_value.iloc[top_positions][
             ["MEDIAN_ASSESSMENT", "SECTOR", "AREA_TYPE"]
         ]
         print("\n  Top 5 Highest Assessments:")
-        for idx, row in top_5.iterrows():
-            print(
-                f"    {idx[0]} ({idx[1]}): ${row['MEDIAN_ASSESSMENT']:,.0f} - {row['SECTOR']}"
-            )
+        for (name, year), median_assess, sector, _ in top_5.itertuples(name=None):
+            print(f"    {name} ({year}): ${median_assess:,.0f} - {sector}")
 
         # 3. Groupby operation
         print("\n3. GROUPBY: Population and Assessment Summary by Sector:")
-        sector_data = self.df[(self.df["SECTOR"].notna()) & (self.df["RES_CNT"] > 0)]
-        sector_stats = sector_data.groupby("SECTOR").agg(
-            {"RES_CNT": "sum", "MEDIAN_ASSESSMENT": "mean", "VACANCY_RATE": "mean"}
-        )
+        sector_stats = self._sector_stats.copy()
         sector_stats.columns = [
             "Total Population",
             "Avg Assessment",
@@ -311,24 +505,14 @@ class CalgaryHousingAnalyzer:
         ]
         sector_stats["Avg Assessment"] = sector_stats["Avg Assessment"].round(0)
         sector_stats["Avg Vacancy Rate"] = (
-            pd.to_numeric(sector_stats["Avg Vacancy Rate"], errors="coerce") * 100
+            sector_stats["Avg Vacancy Rate"] * 100
         ).round(1)
         print(sector_stats.sort_values("Total Population", ascending=False))
 
         # 4. Pivot table
         print("\n4. PIVOT TABLE: Growth by Sector and Year:")
-        pivot_data = self.df[self.df["SECTOR"].notna()].reset_index()
-        pivot = pd.pivot_table(
-            pivot_data,
-            values=["RES_CNT", "MEDIAN_ASSESSMENT", "VACANCY_RATE"],
-            index="SECTOR",
-            columns="YEAR",
-            aggfunc={
-                "RES_CNT": "sum",
-                "MEDIAN_ASSESSMENT": "mean",
-                "VACANCY_RATE": "mean",
-            },
-        )
+        # Spread the cached sector/year summary into one column per year
+        pivot = self._sector_yearly.unstack("YEAR")
         print(pivot.round(2))
 
         print("\n" + "=" * 80)
@@ -339,50 +523,27 @@ class CalgaryHousingAnalyzer:
         print("\nRESEARCH QUESTION 1: Which sectors show the most population growth?")
         print("-" * 70)
 
-        # Calculate actual growth rates using the pivot table data
-        sector_yearly = self.df.groupby(
-            ["SECTOR", self.df.index.get_level_values("YEAR")]
-        ).agg({"RES_CNT": "sum"})
+        # Calculate actual growth rates using the cached sector totals
+        growth_df = self._sector_growth
 
-        growth_data = []
         print("Sector Population Growth Analysis (2016 → 2017):")
-        for sector in sorted(self.df["SECTOR"].dropna().unique()):
-            if (sector, 2016) in sector_yearly.index and (
-                sector,
-                2017,
-            ) in sector_yearly.index:
-                pop_2016 = sector_yearly.loc[(sector, 2016), "RES_CNT"]
-                pop_2017 = sector_yearly.loc[(sector, 2017), "RES_CNT"]
-
-                if pop_2016 > 0:
-                    growth_rate = (pop_2017 - pop_2016) / pop_2016 * 100
-                    change = pop_2017 - pop_2016
-
-                    growth_data.append(
-                        {
-                            "Sector": sector,
-                            "Pop_2016": pop_2016,
-                            "Pop_2017": pop_2017,
-                            "Change": change,
-                            "Growth_Rate": growth_rate,
-                        }
-                    )
-
-                    print(
-                        f"  {sector:12}: {pop_2016:>7,} → {pop_2017:>7,} (+{change:>5,}) = {growth_rate:>+5.1f}%"
-                    )
+        for sector, pop_2016, pop_2017, change, growth_rate in growth_df.itertuples(
+            name=None
+        ):
+            print(
+                f"  {sector:12}: {pop_2016:>7,} → {pop_2017:>7,} (+{change:>5,}) = {growth_rate:>+5.1f}%"
+            )
 
         # Find and highlight the findings
-        growth_df = pd.DataFrame(growth_data)
         if not growth_df.empty:
-            fastest_growing = growth_df.loc[growth_df["Growth_Rate"].idxmax()]
-            largest_absolute = growth_df.loc[growth_df["Change"].idxmax()]
+            fastest_sector = growth_df["Growth_Rate"].idxmax()
+            largest_sector = growth_df["Change"].idxmax()
 
             print(
-                f"\n  KEY FINDING 1A: {fastest_growing['Sector']} has highest growth rate at {fastest_growing['Growth_Rate']:+.1f}%"
+                f"\n  KEY FINDING 1A: {fastest_sector} has highest growth rate at {growth_df.at[fastest_sector, 'Growth_Rate']:+.1f}%"
             )
             print(
-                f"  KEY FINDING 1B: {largest_absolute['Sector']} has largest population increase of {largest_absolute['Change']:,} people"
+                f"  KEY FINDING 1B: {largest_sector} has largest population increase of {growth_df.at[largest_sector, 'Change']:,} people"
             )
 
         # RESEARCH QUESTION 2: Housing Market Assessment Patterns
@@ -393,9 +554,11 @@ class CalgaryHousingAnalyzer:
         highest_assessment = sector_stats.nlargest(3, "Avg Assessment")
         print("Top 3 Sectors by Average Property Assessment:")
 
-        for sector, row in highest_assessment.iterrows():
+        for sector, total_pop, avg_assess, _ in highest_assessment.itertuples(
+            name=None
+        ):
             print(
-                f"  {sector:12}: ${row['Avg Assessment']:>8,.0f} average (Population: {row['Total Population']:>6,})"
+                f"  {sector:12}: ${avg_assess:>8,.0f} average (Population: {total_pop:>6,})"
             )
 
         print(
@@ -423,74 +586,46 @@ class CalgaryHousingAnalyzer:
         print("\nRESEARCH QUESTION 3: How do Inner-City and Suburban areas compare?")
         print("-" * 70)
 
-        # Calculate area type comparisons for both years
-        area_data = self.df[self.df["AREA_TYPE"].notna()]
-        area_yearly = area_data.groupby(
-            ["AREA_TYPE", area_data.index.get_level_values("YEAR")]
-        ).agg(
+        # Calculate area type comparisons for both years, one row per area type
+        area_wide = self._area_yearly.unstack("YEAR").reindex(
+            ["Inner-City", "Suburban"]
+        )
+        area_comparison = pd.DataFrame(
             {
-                "RES_CNT": "sum",
-                "MEDIAN_ASSESSMENT": "mean",
-                "VACANCY_RATE": "mean",
+                "Pop_2016": area_wide[("RES_CNT", 2016)],
+                "Pop_2017": area_wide[("RES_CNT", 2017)],
+                "Assess_2016": area_wide[("MEDIAN_ASSESSMENT", 2016)],
+                "Assess_2017": area_wide[("MEDIAN_ASSESSMENT", 2017)],
+                "Vacancy_2017": area_wide[("VACANCY_RATE", 2017)] * 100,
             }
-        )
+        ).dropna(subset=["Pop_2016", "Pop_2017"])
+
+        pop_2016 = area_comparison["Pop_2016"]
+        assess_2016 = area_comparison["Assess_2016"]
+        area_comparison["Pop_Growth"] = (
+            (area_comparison["Pop_2017"] - pop_2016) / pop_2016 * 100
+        ).where(pop_2016 > 0, 0)
+        area_comparison["Assessment_Growth"] = (
+            (area_comparison["Assess_2017"] - assess_2016) / assess_2016 * 100
+        ).where(assess_2016 > 0, 0)
+        area_comparison["Vacancy_Rate_2017"] = area_comparison["Vacancy_2017"].fillna(0)
 
         print("Area Type Comparison (2016 vs 2017):")
-        area_comparison_data = []
-
-        for area_type in ["Inner-City", "Suburban"]:
-            if (area_type, 2016) in area_yearly.index and (
-                area_type,
-                2017,
-            ) in area_yearly.index:
-                pop_2016 = area_yearly.loc[(area_type, 2016), "RES_CNT"]
-                pop_2017 = area_yearly.loc[(area_type, 2017), "RES_CNT"]
-
-                assess_2016 = area_yearly.loc[(area_type, 2016), "MEDIAN_ASSESSMENT"]
-                assess_2017 = area_yearly.loc[(area_type, 2017), "MEDIAN_ASSESSMENT"]
-
-                vacancy_2017 = area_yearly.loc[(area_type, 2017), "VACANCY_RATE"]
-
-                pop_growth = (
-                    (pop_2017 - pop_2016) / pop_2016 * 100 if pop_2016 > 0 else 0
-                )
-                assess_growth = (
-                    (assess_2017 - assess_2016) / assess_2016 * 100
-                    if pd.notna(assess_2016) and assess_2016 > 0
-                    else 0
-                )
-
-                area_comparison_data.append(
-                    {
-                        "Area_Type": area_type,
-                        "Pop_Growth": pop_growth,
-                        "Assessment_Growth": assess_growth,
-                        "Vacancy_Rate_2017": vacancy_2017 * 100
-                        if pd.notna(vacancy_2017)
-                        else 0,
-                        "Pop_2017": pop_2017,
-                    }
-                )
-
-                print(f"\n  {area_type}:")
-                print(
-                    f"    Population Growth: {pop_growth:>+5.1f}% ({pop_2016:,} → {pop_2017:,})"
-                )
-                print(
-                    f"    Assessment Growth: {assess_growth:>+5.1f}% (${assess_2016:,.0f} → ${assess_2017:,.0f})"
-                )
-                print(f"    2017 Vacancy Rate: {vacancy_2017 * 100:>5.1f}%")
+        for row in area_comparison.itertuples():
+            print(f"\n  {row.Index}:")
+            print(
+                f"    Population Growth: {row.Pop_Growth:>+5.1f}% ({row.Pop_2016:,} → {row.Pop_2017:,})"
+            )
+            print(
+                f"    Assessment Growth: {row.Assessment_Growth:>+5.1f}% (${row.Assess_2016:,.0f} → ${row.Assess_2017:,.0f})"
+            )
+            print(f"    2017 Vacancy Rate: {row.Vacancy_2017:>5.1f}%")
 
         # Generate key findings
+        area_comparison_data = area_comparison.to_dict("index")
         if len(area_comparison_data) == 2:
-            inner_city = next(
-                item
-                for item in area_comparison_data
-                if item["Area_Type"] == "Inner-City"
-            )
-            suburban = next(
-                item for item in area_comparison_data if item["Area_Type"] == "Suburban"
-            )
+            inner_city = area_comparison_data["Inner-City"]
+            suburban = area_comparison_data["Suburban"]
 
             print(
                 f"\n  KEY FINDING 3A: {'Suburban' if suburban['Pop_Growth'] > inner_city['Pop_Growth'] else 'Inner-City'} areas growing faster"
@@ -517,10 +652,7 @@ class CalgaryHousingAnalyzer:
         print("=" * 80)
 
         if not growth_df.empty:
-            fastest_sector = growth_df.loc[growth_df["Growth_Rate"].idxmax(), "Sector"]
-            fastest_rate = growth_df.loc[
-                growth_df["Growth_Rate"].idxmax(), "Growth_Rate"
-            ]
+            fastest_rate = growth_df.at[fastest_sector, "Growth_Rate"]
             print(
                 f"1. FASTEST GROWING SECTOR: {fastest_sector} (+{fastest_rate:.1f}% population growth)"
             )
@@ -543,7 +675,7 @@ class CalgaryHousingAnalyzer:
             print(f"3. DEVELOPMENT PATTERN: Calgary shows {urban_pattern} trend")
 
         print(
-            f"4. DATA QUALITY: Analysis based on {len(sector_data)} valid records from {len(self.df)} total"
+            f"4. DATA QUALITY: Analysis based on {self._sector_mask.sum()} valid records from {len(self.df)} total"
         )
         print("=" * 80)
 
@@ -553,6 +685,12 @@ class CalgaryHousingAnalyzer:
         """
         print("Creating research visualizations...")
 
+        # Render off-screen with Agg when nobody can see a plot window (output
+        # piped or redirected); the figure is still saved to disk either way
+        interactive = sys.stdout.isatty()
+        if not interactive:
+            plt.switch_backend("Agg")
+
         # Set up matplotlib style and figure
         plt.style.use("default")
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
@@ -565,35 +703,10 @@ class CalgaryHousingAnalyzer:
         # 1. RESEARCH QUESTION 1: Sector Population Growth
         print("  Creating Chart 1: Sector Population Growth...")
 
-        # Calculate growth data
-        sector_yearly = self.df.groupby(
-            ["SECTOR", self.df.index.get_level_values("YEAR")]
-        ).agg({"RES_CNT": "sum"})
-
-        growth_data = []
-        for sector in self.df["SECTOR"].dropna().unique():
-            if (sector, 2016) in sector_yearly.index and (
-                sector,
-                2017,
-            ) in sector_yearly.index:
-                pop_2016 = sector_yearly.loc[(sector, 2016), "RES_CNT"]
-                pop_2017 = sector_yearly.loc[(sector, 2017), "RES_CNT"]
-
-                if pop_2016 > 0:
-                    growth_rate = (pop_2017 - pop_2016) / pop_2016 * 100
-                    growth_data.append(
-                        {
-                            "Sector": sector,
-                            "Growth_Rate": growth_rate,
-                            "Pop_2017": pop_2017,
-                        }
-                    )
-
-        if growth_data:
-            growth_df = pd.DataFrame(growth_data).sort_values(
-                "Growth_Rate", ascending=True
-            )
+        # Calculate growth data (shared with perform_analysis)
+        growth_df = self._sector_growth.sort_values("Growth_Rate", ascending=True)
 
+        if not growth_df.empty:
             # Create horizontal bar chart
             colors = [
                 "#d73027" if x < 0 else "#1a9850" for x in growth_df["Growth_Rate"]
@@ -607,7 +720,7 @@ class CalgaryHousingAnalyzer:
             )
 
             ax1.set_yticks(range(len(growth_df)))
-            ax1.set_yticklabels(growth_df["Sector"], fontsize=10)
+            ax1.set_yticklabels(growth_df.index, fontsize=10)
             ax1.set_xlabel("Population Growth Rate (%)", fontsize=12, fontweight="bold")
             ax1.set_title(
                 "Q1: Population Growth by Sector (2016→2017)",
@@ -617,32 +730,21 @@ class CalgaryHousingAnalyzer:
             ax1.grid(axis="x", alpha=0.3)
             ax1.axvline(x=0, color="black", linewidth=1)
 
-            # Add value labels
-            for i, (bar, value) in enumerate(zip(bars, growth_df["Growth_Rate"])):
-                label_x = value + 0.1 if value >= 0 else value - 0.1
-                ax1.text(
-                    label_x,
-                    bar.get_y() + bar.get_height() / 2,
-                    f"{value:.1f}%",
-                    va="center",
-                    ha="left" if value >= 0 else "right",
-                    fontweight="bold",
-                    fontsize=9,
-                )
+            # Add value labels (placed past the end of each bar, either direction)
+            ax1.bar_label(
+                bars,
+                labels=[f"{value:.1f}%" for value in growth_df["Growth_Rate"]],
+                padding=3,
+                fontweight="bold",
+                fontsize=9,
+            )
 
         # 2. RESEARCH QUESTION 2: Property Values by Sector
         print("  Creating Chart 2: Property Values Analysis...")
 
-        # Get sector data with valid assessments
-        sector_data = self.df[
-            (self.df["SECTOR"].notna())
-            & (self.df["MEDIAN_ASSESSMENT"].notna())
-            & (self.df["RES_CNT"] > 0)
-        ]
-        sector_stats = (
-            sector_data.groupby("SECTOR")
-            .agg({"RES_CNT": "sum", "MEDIAN_ASSESSMENT": "mean"})
-            .sort_values("MEDIAN_ASSESSMENT", ascending=False)
+        # Get sector statistics (mean skips missing assessments)
+        sector_stats = self._sector_stats[["RES_CNT", "MEDIAN_ASSESSMENT"]].sort_values(
+            "MEDIAN_ASSESSMENT", ascending=False
         )
 
         if len(sector_stats) > 0:
@@ -669,72 +771,77 @@ class CalgaryHousingAnalyzer:
             ax2.grid(axis="y", alpha=0.3)
 
             # Add value labels on bars
-            for bar, value in zip(bars, sector_stats["MEDIAN_ASSESSMENT"]):
-                ax2.text(
-                    bar.get_x() + bar.get_width() / 2,
-                    bar.get_height() + 5,
-                    f"${value / 1000:.0f}K",
-                    ha="center",
-                    va="bottom",
-                    fontweight="bold",
-                    fontsize=9,
-                )
+            ax2.bar_label(
+                bars,
+                labels=[
+                    f"${value / 1000:.0f}K"
+                    for value in sector_stats["MEDIAN_ASSESSMENT"]
+                ],
+                padding=3,
+                fontweight="bold",
+                fontsize=9,
+            )
 
         # 3. RESEARCH QUESTION 3: Inner-City vs Suburban Growth
         print("  Creating Chart 3: Area Type Comparison...")
 
-        # Calculate area type data
-        area_data = self.df[self.df["AREA_TYPE"].notna()]
-        area_yearly = area_data.groupby(
-            ["AREA_TYPE", area_data.index.get_level_values("YEAR")]
-        ).agg({"RES_CNT": "sum"})
-
         area_colors = {"Inner-City": "#e74c3c", "Suburban": "#3498db"}
         markers = {"Inner-City": "o", "Suburban": "s"}
         years = [2016, 2017]
 
+        # Calculate area type data: one row per area type with a population
+        # column for each year (area types missing either year are left out)
+        populations = self._area_yearly["RES_CNT"]
+        area_pop = (
+            populations.unstack("YEAR")
+            .reindex(columns=years)
+            .dropna()
+            .astype(populations.dtype)
+        )
+        change = area_pop[2017] - area_pop[2016]
+        area_pop = area_pop.assign(
+            Change=change, Growth_Rate=change / area_pop[2016] * 100
+        )
+
         growth_data = {}
-        max_pop = 0
-
-        for area_type in area_yearly.index.get_level_values("AREA_TYPE").unique():
-            if (area_type, 2016) in area_yearly.index and (
-                area_type,
-                2017,
-            ) in area_yearly.index:
-                pop_2016 = area_yearly.loc[(area_type, 2016), "RES_CNT"]
-                pop_2017 = area_yearly.loc[(area_type, 2017), "RES_CNT"]
-                pop_data = [pop_2016, pop_2017]
-
-                # Calculate growth metrics
-                growth_rate = (pop_2017 - pop_2016) / pop_2016 * 100
-                change_abs = pop_2017 - pop_2016
-
-                growth_data[area_type] = {
-                    "pop_data": pop_data,
-                    "growth_rate": growth_rate,
-                    "change_abs": change_abs,
-                    "pop_2016": pop_2016,
-                    "pop_2017": pop_2017,
-                }
-
-                max_pop = max(max_pop, max(pop_data))
-
-                # Plot line with enhanced styling
-                ax3.plot(
-                    years,
-                    pop_data,
-                    marker=markers.get(area_type, "^"),
-                    linewidth=4,
-                    markersize=14,
-                    label=f"{area_type}",
-                    color=area_colors.get(area_type, "#2E86AB"),
-                    markeredgecolor="white",
-                    markeredgewidth=2,
-                    alpha=0.8,
-                )
+
+        for (
+            area_type,
+            pop_2016,
+            pop_2017,
+            change_abs,
+            growth_rate,
+        ) in area_pop.itertuples(name=None):
+            pop_data = [pop_2016, pop_2017]
+            growth_data[area_type] = {
+                "pop_data": pop_data,
+                "growth_rate": growth_rate,
+                "change_abs": change_abs,
+                "pop_2016": pop_2016,
+                "pop_2017": pop_2017,
+            }
+
+            # Plot line with enhanced styling
+            ax3.plot(
+                years,
+                pop_data,
+                marker=markers.get(area_type, "^"),
+                linewidth=4,
+                markersize=14,
+                label=f"{area_type}",
+                color=area_colors.get(area_type, "#2E86AB"),
+                markeredgecolor="white",
+                markeredgewidth=2,
+                alpha=0.8,
+            )
+
+        # Every plotted population in one array, so the label offset and the
+        # y-axis limits come from a single min/max pair
+        all_pops = np.concatenate([data["pop_data"] for data in growth_data.values()])
+        pop_min, pop_max = all_pops.min(), all_pops.max()
 
         # Add data labels with better positioning
-        label_offset = max_pop * 0.02  # Dynamic offset based on data scale
+        label_offset = pop_max * 0.02  # Dynamic offset based on data scale
 
         for area_type, data in growth_data.items():
             color = area_colors.get(area_type, "#2E86AB")
@@ -803,22 +910,18 @@ class CalgaryHousingAnalyzer:
         ax3.grid(alpha=0.3, linestyle="--")
         ax3.set_xticks(years)
         ax3.set_xlim(2015.8, 2017.2)  # Add some padding on x-axis
-        ax3.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"{x:,.0f}"))
+        ax3.yaxis.set_major_formatter(StrMethodFormatter("{x:,.0f}"))
 
         # Set y-axis limits with some padding
-        y_min = min([min(data["pop_data"]) for data in growth_data.values()]) * 0.95
-        y_max = max([max(data["pop_data"]) for data in growth_data.values()]) * 1.15
-        ax3.set_ylim(y_min, y_max)
+        ax3.set_ylim(pop_min * 0.95, pop_max * 1.15)
 
         # 4. Summary Statistics
         print("  Creating Chart 4: Dataset Summary...")
 
         # Create summary metrics
         total_records = len(self.df)
-        valid_records = len(
-            self.df[(self.df["SECTOR"].notna()) & (self.df["RES_CNT"] > 0)]
-        )
-        communities = self.df.index.get_level_values("COMMUNITY_NAME").nunique()
+        valid_records = int(self._sector_mask.sum())
+        communities = len(self._communities)
 
         # Sector distribution pie chart
         if self.df["SECTOR"].notna().any():
@@ -867,14 +970,61 @@ class CalgaryHousingAnalyzer:
         plt.tight_layout()
         plt.subplots_adjust(top=0.93)
 
-        # Save the figure
+        # Save the figure (150 DPI is sharp for on-screen and report use and has a
+        # quarter of the pixels of 300 DPI)
         filename = "calgary_housing_research_analysis.png"
         plt.savefig(
-            filename, dpi=300, bbox_inches="tight", facecolor="white", edgecolor="none"
+            filename, dpi=150, bbox_inches="tight", facecolor="white", edgecolor="none"
         )
         print(f"  Visualization saved as: {filename}")
 
-        plt.show()
+        if interactive:
+            plt.show()
+        else:
+            plt.close(fig)
+
+    @staticmethod
+    def _append_frame(worksheet, frame, index=True):
+        """
+        Append a DataFrame to a write-only worksheet using the same layout as
+        DataFrame.to_excel: header row(s) first, then one row per record with the
+        index values in the leading columns. Missing values are left as empty cells.
+
+        Parameters:
+            worksheet (openpyxl.worksheet._write_only.WriteOnlyWorksheet): Sheet to write to
+            frame (pd.DataFrame): Data to write
+            index (bool): Whether to write the index values before each row
+        Returns:
+            None
+        """
+        index_names = list(frame.index.names) if index else []
+        if isinstance(frame.columns, pd.MultiIndex):
+            # One header row per column level (each label shown once per group),
+            # then a row holding the index names
+            for level, name in enumerate(frame.columns.names):
+                prefixes = [column[: level + 1] for column in frame.columns]
+                shown = [
+                    None if i > 0 and prefix == prefixes[i - 1] else prefix[-1]
+                    for i, prefix in enumerate(prefixes)
+                ]
+                leading = [None] * (len(index_names) - 1) + [name] if index else []
+                worksheet.append([*leading, *shown])
+            if index:
+                worksheet.append(index_names)
+        else:
+            worksheet.append([*index_names, *frame.columns])
+
+        # Stream plain tuples straight from the frame (no object-dtype copy of the
+        # whole frame), blanking missing values cell by cell
+        rows = frame.itertuples(index=False, name=None)
+        for label, row in zip(frame.index, rows):
+            cells = tuple(None if pd.isna(value) else value for value in row)
+            if not index:
+                worksheet.append(cells)
+            elif isinstance(label, tuple):
+                worksheet.append((*label, *cells))
+            else:
+                worksheet.append((label, *cells))
 
     def export_to_excel(self):
         """
@@ -885,52 +1035,50 @@ class CalgaryHousingAnalyzer:
         Returns:
             None
         """
-        # Create Excel writer object
+        # Create a write-only workbook: rows are streamed to disk as they are
+        # appended instead of being held as a grid of cell objects
         filename = "calgary_housing_complete_analysis.xlsx"
+        workbook = Workbook(write_only=True)
 
-        with pd.ExcelWriter(filename, engine="openpyxl") as writer:
-            # Export main dataset
-            self.df.to_excel(writer, sheet_name="Complete Dataset")
-
-            # Add summary statistics sheet
-            summary_stats = self.df.describe()
-            summary_stats.to_excel(writer, sheet_name="Summary Statistics")
-
-            # Add pivot table sheet
-            pivot_data = self.df[self.df["SECTOR"].notna()].reset_index()
-            pivot = pd.pivot_table(
-                pivot_data,
-                values=["MEDIAN_ASSESSMENT", "RES_CNT", "VACANCY_RATE"],
-                index="SECTOR",
-                columns="YEAR",
-                aggfunc="mean",
-            )
-            pivot.to_excel(writer, sheet_name="Sector Analysis Pivot")
-
-            # Add high-value communities sheet
-            high_value_mask = (self.df["MEDIAN_ASSESSMENT"] > 600000) & self.df[
-                "MEDIAN_ASSESSMENT"
-            ].notna()
-            high_value = self.df[high_value_mask]
-            high_value.to_excel(writer, sheet_name="High Value Communities")
-
-            # Add missing values summary sheet
-            missing_summary = pd.DataFrame(
-                {
-                    "Column": self.df.columns,
-                    "Missing Count": [
-                        self.df[col].isna().sum() for col in self.df.columns
-                    ],
-                    "Missing %": [
-                        (self.df[col].isna().sum() / len(self.df) * 100)
-                        for col in self.df.columns
-                    ],
-                }
-            )
-            missing_summary = missing_summary[missing_summary["Missing Count"] > 0]
-            missing_summary.to_excel(
-                writer, sheet_name="Missing Values Summary", index=False
-            )
+        # Export main dataset
+        self._append_frame(workbook.create_sheet("Complete Dataset"), self.df)
+
+        # Add summary statistics sheet
+        summary_stats = self.df.describe()
+        self._append_frame(workbook.create_sheet("Summary Statistics"), summary_stats)
+
+        # Add pivot table sheet (grouping on the YEAR index level avoids a
+        # reset_index() copy of the whole frame)
+        pivot = (
+            self.df.groupby(["SECTOR", self._year_level], observed=True)[
+                ["MEDIAN_ASSESSMENT", "RES_CNT", "VACANCY_RATE"]
+            ]
+            .mean()
+            .unstack("YEAR")
+        )
+        self._append_frame(workbook.create_sheet("Sector Analysis Pivot"), pivot)
+
+        # Add high-value communities sheet (the comparison excludes missing values)
+        high_value = self.df[self._high_value_mask]
+        self._append_frame(workbook.create_sheet("High Value Communities"), high_value)
+
+        # Add missing values summary sheet (one count() pass for all columns)
+        missing_counts = len(self.df) - self.df.count()
+        missing_summary = pd.DataFrame(
+            {
+                "Column": missing_counts.index,
+                "Missing Count": missing_counts.to_numpy(),
+                "Missing %": (missing_counts / len(self.df) * 100).to_numpy(),
+            }
+        )
+        missing_summary = missing_summary[missing_summary["Missing Count"] > 0]
+        self._append_frame(
+            workbook.create_sheet("Missing Values Summary"),
+            missing_summary,
+            index=False,
+        )
+
+        workbook.save(filename)
 
         print(f"\nComplete dataset exported to '{filename}'")
         print(f"  - Main dataset: {len(self.df)} records")
@@ -23,14 +23,92 @@ Derived Metrics:
 Output:
 - Exports cleaned dataset to 'cleaned_calgary_housing_demographics.csv'
 - Creates multi-index DataFrame (COMMUNITY_NAME, YEAR) sorted alphabetically
+- Caches the merged DataFrame to 'cache/merged.parquet' for faster reloads
 """
 
+import os
+import re
+
+import numpy as np
 import pandas as pd
 
 # ------------------------------------------------------------------ constants
 YEARS = (2016, 2017)
 COL_NAME = "COMMUNITY_NAME"
 
+# Explicit dtypes so read_csv can skip type inference (counts keep NaN, so float32).
+# Text columns use Arrow-backed strings rather than Python string objects
+ARROW_STRING = "string[pyarrow]"
+CENSUS_DTYPES = {
+    "CENSUS_YEAR": "int16",
+    "COMM_CODE": ARROW_STRING,
+    "COMMUNITY": ARROW_STRING,
+    "DWELLING_TYPE": ARROW_STRING,
+    "DWELLING_TYPE_DESCRIPTION": ARROW_STRING,
+    "WARD": "float32",
+    "DWELLING_TYPE_CODE": "int8",
+    "DWELLING_CNT": "float32",
+    "RESIDENT_CNT": "float32",
+    "OCPD_DWELLING_CNT": "float32",
+    "VACANT_DWELLING_CNT": "float32",
+    "OCPD_OWNERSHIP_CNT": "float32",
+    "RENOVATION_DWELLING_CNT": "float32",
+    "UNDER_CONST_DWELLING_CNT": "float32",
+    "INACTIVE_CNT": "float32",
+    "OTHER_PURPOSE_CNT": "float32",
+}
+ASSESSMENT_DTYPES = {
+    "date": "int16",
+    "Community name": ARROW_STRING,
+    "COMM_CODE": ARROW_STRING,
+}
+WARD_DTYPES = {
+    "COMM_CODE": ARROW_STRING,
+    "CLASS": ARROW_STRING,
+    "CLASS_CODE": "int8",
+    "NAME": ARROW_STRING,
+    "SECTOR": ARROW_STRING,
+    "SRG": ARROW_STRING,
+    "COMM_STRUCTURE": ARROW_STRING,
+    "WARD_NUM": "int8",
+}
+
+# Explicit inner-city COMM_STRUCTURE classifications
+INNER_CITY_STRUCTURES = (
+    "INNER CITY",
+    "CENTRE CITY",
+    "INNER-CITY",
+    "CENTER CITY",
+    "DOWNTOWN",
+)
+
+# Communities developed before 1980 are typically inner-city
+INNER_CITY_DECADES = (
+    "PRE 1910",
+    "PRE-1910",
+    "BEFORE 1910",
+    "1910S",
+    "1920S",
+    "1930S",
+    "1940S",
+    "1950S",
+    "1960S",
+    "1970S",
+    "1960S/1970S",
+    "1960/1970",
+    "1960-1970",
+)
+INNER_CITY_DECADE_PATTERN = re.compile(
+    "|".join(re.escape(decade) for decade in INNER_CITY_DECADES)
+)
+
+# Merged dataset cache, reused while it is newer than the CSVs and this module
+CACHE_PATH = os.path.join("cache", "merged.parquet")
+
+# The census file covers every year since 1998, so it is streamed in chunks and
+# filtered to YEARS before the chunks are combined
+CENSUS_CHUNK_SIZE = 10_000
+
 
 # ------------------------------------------------------------------ helpers
 def clean_names(df, col):
@@ -45,13 +123,13 @@ def clean_names(df, col):
         None. The DataFrame is modified in place.
     """
     if col in df.columns:
-        df[col] = df[col].astype(str).str.upper().str.strip()
+        df[col] = df[col].astype(ARROW_STRING).str.upper().str.strip()
 
 
-def map_inner_city(comm_structure_value):
+def map_inner_city(comm_structure):
     """
-    Classify a community as 'Inner-City' or 'Suburban' based on COMM_STRUCTURE
-    value from Calgary's classification system.
+    Classify communities as 'Inner-City' or 'Suburban' based on their COMM_STRUCTURE
+    values from Calgary's classification system, for a whole column at once.
 
     Calgary's COMM_STRUCTURE indicates development timeline:
     - 'INNER CITY': Explicitly marked inner-city communities
@@ -60,81 +138,49 @@ def map_inner_city(comm_structure_value):
     - Post-1980s decades: Newer suburban developments
     - 'BUILDING OUT': Currently developing (suburban)
 
+    Anything that is not an explicit inner-city structure and does not mention a
+    pre-1980s decade (including missing values) is classified as Suburban.
+
+    Parameters:
+        comm_structure (pd.Series): The community COMM_STRUCTURE values.
+    Returns:
+        pd.Series: 'Inner-City' or 'Suburban' classification for each value.
+    """
+    structure = comm_structure.astype("string").str.upper().str.strip()
+
+    # Exact inner-city matches, or any pre-1980s decade within the value
+    is_inner_city = structure.isin(INNER_CITY_STRUCTURES) | structure.str.contains(
+        INNER_CITY_DECADE_PATTERN, na=False
+    )
+
+    return pd.Series(
+        np.where(is_inner_city, "Inner-City", "Suburban"), index=comm_structure.index
+    )
+
+
+def is_cache_fresh(cache_path, source_paths):
+    """
+    Checks whether a cached dataset is newer than every file it was built from.
+    This module is included as a source so edits to the cleaning logic also invalidate the cache.
+
     Parameters:
-        comm_structure_value (str): The community COMM_STRUCTURE value.
+        cache_path (str): Path to the cached dataset.
+        source_paths (iterable of str): Paths to the source CSV files.
     Returns:
-        str: 'Inner-City' or 'Suburban' classification.
+        bool: True if the cache exists and is newer than all sources, otherwise False.
     """
-    if not isinstance(comm_structure_value, str):
-        return "Suburban"  # Default if no structure info
-
-    structure = comm_structure_value.upper().strip()
-
-    # Explicit inner-city classifications
-    inner_city_structures = {
-        "INNER CITY",
-        "CENTRE CITY",
-        "INNER-CITY",
-        "CENTER CITY",
-        "DOWNTOWN",
-    }
-
-    # Check for exact matches
-    if structure in inner_city_structures:
-        return "Inner-City"
-
-    # Decade-based classification
-    # Communities developed before 1980 are typically inner-city
-    inner_city_decades = {
-        "PRE 1910",
-        "PRE-1910",
-        "BEFORE 1910",
-        "1910S",
-        "1920S",
-        "1930S",
-        "1940S",
-        "1950S",
-        "1960S",
-        "1970S",
-        "1960S/1970S",
-        "1960/1970",
-        "1960-1970",
-    }
-
-    # Check decade-based classification
-    for decade in inner_city_decades:
-        if decade in structure:
-            return "Inner-City"
-
-    # Suburban indicators
-    suburban_structures = {
-        "BUILDING OUT",
-        "BUILDOUT",
-        "BUILD OUT",
-        "DEVELOPING",
-        "FUTURE",
-        "1980S",
-        "1990S",
-        "2000S",
-        "2010S",
-        "2020S",
-        "NEW",
-        "GREENFIELD",
-    }
-
-    # Check for suburban matches
-    for suburban in suburban_structures:
-        if suburban in structure:
-            return "Suburban"
-
-    # Default to Suburban for unknown structures
-    return "Suburban"
+    if not os.path.exists(cache_path):
+        return False
+    cache_time = os.path.getmtime(cache_path)
+    return all(
+        os.path.getmtime(path) < cache_time for path in (*source_paths, __file__)
+    )
 
 
 # ------------------------------------------------------------------ load and prepare data
 
 
-def load_and_prepare_data(census_path, assessment_path, ward_path):
+def load_and_prepare_data(census_path, assessment_path, ward_path, use_cache=False):
     """
     Loads, cleans, merges, and enriches three Calgary community datasets (census, assessment, and ward info).
     Standardizes columns, filters years, merges on community and year, and adds calculated columns.
@@ -143,13 +189,34 @@ def load_and_prepare_data(census_path, assessment_path, ward_path):
         census_path (str): Path to the census CSV file.
         assessment_path (str): Path to the assessment CSV file.
         ward_path (str): Path to the ward/community info CSV file.
+        use_cache (bool): If True, return the dataset cached at CACHE_PATH when it is
+            newer than the sources instead of rebuilding it.
     Returns:
         pd.DataFrame: The cleaned, merged, and enriched DataFrame, indexed by community and year.
+        A copy is also written to CACHE_PATH.
     """
-    # Load the three CSV files into DataFrames
-    census = pd.read_csv(census_path)
-    assess = pd.read_csv(assessment_path)
-    ward = pd.read_csv(ward_path)
+    # Reuse the cached dataset from a previous run unless a source file changed
+    # (memory-mapped, so the columns are read without an extra buffered copy)
+    if use_cache and is_cache_fresh(
+        CACHE_PATH, (census_path, assessment_path, ward_path)
+    ):
+        return pd.read_parquet(CACHE_PATH, engine="pyarrow", memory_map=True)
+
+    # Load the three CSV files into DataFrames (counts use "," as a thousands separator)
+    census_chunks = pd.read_csv(
+        census_path,
+        dtype=CENSUS_DTYPES,
+        thousands=",",
+        engine="c",
+        chunksize=CENSUS_CHUNK_SIZE,
+    )
+    census = pd.concat(
+        chunk[chunk["CENSUS_YEAR"].isin(YEARS)] for chunk in census_chunks
+    )
+    assess = pd.read_csv(
+        assessment_path, dtype=ASSESSMENT_DTYPES, thousands=",", engine="c"
+    )
+    ward = pd.read_csv(ward_path, dtype=WARD_DTYPES, engine="c")
 
     # Standardize ward/community DataFrame column names for merging
     ward = ward.rename(columns={"NAME": COL_NAME, "sector": "SECTOR"})
@@ -158,7 +225,7 @@ def load_and_prepare_data(census_path, assessment_path, ward_path):
     if "AREA_TYPE" not in ward.columns:
         if "COMM_STRUCTURE" in ward.columns:
             # Use the COMM_STRUCTURE column for classification
-            ward["AREA_TYPE"] = ward["COMM_STRUCTURE"].apply(map_inner_city)
+            ward["AREA_TYPE"] = map_inner_city(ward["COMM_STRUCTURE"])
             print("\nArea Type Classification Summary:")
             print(ward["AREA_TYPE"].value_counts())
             print("\nSample classifications:")
@@ -198,54 +265,73 @@ def load_and_prepare_data(census_path, assessment_path, ward_path):
         }
     )
 
-    # Filter census and assessment data to only include the years of interest
-    census = census[census["YEAR"].isin(YEARS)]
-    assess = assess[assess["YEAR"].isin(YEARS)]
-
     # Clean up community names in all DataFrames for reliable merging
     for df in (census, assess, ward):
         clean_names(df, COL_NAME)
 
-    # Remove duplicate assessment rows (by community and year)
-    assess.drop_duplicates(subset=[COL_NAME, "YEAR"], keep="first", inplace=True)
-
-    # Remove system/unclassified rows from all DataFrames
+    # Remove system/unclassified rows from all DataFrames with boolean filters.
+    # The assessment year filter shares the same mask (census is filtered by
+    # year while it is read)
     EXCLUDE_NAME = "SYSTEM/UNCLASSIFIED/RESIDUAL WARD"
-    for df in (census, assess, ward):
-        df.drop(df[df[COL_NAME] == EXCLUDE_NAME].index, inplace=True)
+    census = census[census[COL_NAME] != EXCLUDE_NAME]
+    assess = assess[assess["YEAR"].isin(YEARS) & (assess[COL_NAME] != EXCLUDE_NAME)]
+    ward = ward[ward[COL_NAME] != EXCLUDE_NAME]
+
+    # Remove duplicate assessment rows (by community and year)
+    assess = assess.drop_duplicates(subset=[COL_NAME, "YEAR"], keep="first")
 
     # Remove redundant columns from census and assessment DataFrames
-    for col in ("SECTOR", "AREA_TYPE"):
-        census.drop(columns=col, errors="ignore", inplace=True)
-        assess.drop(columns=col, errors="ignore", inplace=True)
+    census = census.drop(columns=["SECTOR", "AREA_TYPE"], errors="ignore")
+    assess = assess.drop(columns=["SECTOR", "AREA_TYPE"], errors="ignore")
 
     # Merge census and ward DataFrames on community name
     merged = pd.merge(census, ward, on=COL_NAME, how="left", validate="m:1")
     # Merge in assessment DataFrame on community name and year
     merged = pd.merge(merged, assess, on=[COL_NAME, "YEAR"], how="left", validate="m:1")
 
-    # Convert important columns to numeric, removing commas and filling missing with 0
-    for col in ("MEDIAN_ASSESSMENT", "RES_CNT", "DWELLINGS_VACANT", "DWELLINGS_TOTAL"):
-        merged[col] = (
-            merged[col]
-            .astype(str)
-            .str.replace(",", "", regex=False)
-            .astype(float)
-            .fillna(0)
+    # Convert important columns to numeric in one block, filling missing with 0
+    # (read_csv already stripped the thousands separators)
+    numeric_cols = [
+        "MEDIAN_ASSESSMENT",
+        "RES_CNT",
+        "DWELLINGS_VACANT",
+        "DWELLINGS_TOTAL",
+    ]
+    merged[numeric_cols] = (
+        merged[numeric_cols]
+        .apply(pd.to_numeric, errors="coerce")
+        .astype("float64")
+        .fillna(0)
+    )
+
+    # Add calculated columns: assessment per person and vacancy rate (NaN where
+    # the denominator is 0, so the results stay plain float64 columns)
+    res_cnt = merged["RES_CNT"].to_numpy()
+    dwellings_total = merged["DWELLINGS_TOTAL"].to_numpy()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        merged["ASSESSMENT_PER_PERSON"] = np.where(
+            res_cnt != 0, merged["MEDIAN_ASSESSMENT"].to_numpy() / res_cnt, np.nan
+        )
+        merged["VACANCY_RATE"] = np.where(
+            dwellings_total != 0,
+            merged["DWELLINGS_VACANT"].to_numpy() / dwellings_total,
+            np.nan,
         )
 
-    # Add calculated columns: assessment per person and vacancy rate
-    merged["ASSESSMENT_PER_PERSON"] = merged["MEDIAN_ASSESSMENT"] / merged[
-        "RES_CNT"
-    ].replace(0, pd.NA)
-    merged["VACANCY_RATE"] = merged["DWELLINGS_VACANT"] / merged[
-        "DWELLINGS_TOTAL"
-    ].replace(0, pd.NA)
+    # Store low-cardinality label columns as categories (integer codes instead of
+    # repeated strings). WARD stays numeric so the analyzer can coalesce it with WARD_NUM
+    for col in ("SECTOR", "AREA_TYPE", "DWELLING_TYPE_DESCRIPTION"):
+        if col in merged.columns:
+            merged[col] = merged[col].astype("category")
 
     # Set a multi-level index (community name and year) and sort the DataFrame
     merged.set_index([COL_NAME, "YEAR"], inplace=True)
     merged.sort_index(inplace=True)
 
+    # Cache the result so later runs can skip parsing and merging the CSVs
+    os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+    merged.to_parquet(CACHE_PATH, index=True)
+
     # Return the cleaned, merged, and enriched DataFrame
     return merged
 
@@ -276,7 +362,9 @@ def main():
     print("\n" + "=" * 60)
     print("Descriptive Statistics for the Cleaned Dataset (2016–2017)")
     print("=" * 60)
-    print(df.describe(include="all"))
+    print(df.select_dtypes("number").describe())
+    print("\nText and category columns (non-null count and distinct values):")
+    print(df.select_dtypes(exclude="number").agg(["count", "nunique"]).T)
     print("\n" + "=" * 60)
     print("Missing values per column:")
     print(df.isna().sum())
@@ -284,7 +372,7 @@ def main():
     # Show area type distribution
     print("\n" + "=" * 60)
     print("Area Type Distribution in Final Dataset:")
-    area_counts = df.groupby("AREA_TYPE").size()
+    area_counts = df.groupby("AREA_TYPE", observed=True).size()
     print(area_counts)
     print("=" * 60)
 